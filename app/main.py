@@ -4,23 +4,40 @@ All-in-one FastAPI application (no database, no separate files needed)
 Perfect for quick demos and rapid prototyping
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic.networks import validate_email
+import msgspec
+import orjson
+from typing import Annotated, List, Optional
+from contextlib import asynccontextmanager
+import anyio
 from datetime import datetime, timedelta
-from uuid import uuid4
+import time
+from bisect import bisect_left, bisect_right
+import secrets
+import re
 
 # =====================================================
 # INITIALIZE FASTAPI APP
 # =====================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Enlarge the threadpool that runs the sync (def) endpoints"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+    yield
+
 app = FastAPI(
     title="SPOC Booking Platform API",
     description="Demo version - No database required",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware to allow frontend communication
@@ -32,6 +49,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger list responses (small payloads like /health are skipped)
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # =====================================================
 # HARDCODED DATA - SPOCs
 # =====================================================
@@ -63,6 +83,33 @@ SPOCS_DATA = [
     }
 ]
 
+# Index SPOCs by ID for O(1) lookups
+SPOCS_BY_ID = {s["spoc_id"]: s for s in SPOCS_DATA}
+
+# Lowercased filter fields, computed once: field -> [(spoc, lowercased value)].
+# Kept out of SPOCS_DATA so they don't leak into API responses.
+SPOCS_FILTER_KEYS = {
+    field: [(s, s[field].lower()) for s in SPOCS_DATA]
+    for field in ("expertise", "specialization")
+}
+
+def build_keyword_index(field):
+    """
+    Inverted index over one lowercased filter field
+    Maps each word in the field to every SPOC whose field contains that word
+    as a substring - the same result the substring filter would give
+    """
+    keys = SPOCS_FILTER_KEYS[field]
+    index = {}
+    for _, value in keys:
+        for token in re.findall(r"\w+", value):
+            if token not in index:
+                index[token] = [spoc for spoc, v in keys if token in v]
+    return index
+
+SPOCS_BY_EXPERTISE_LC = build_keyword_index("expertise")
+SPOCS_BY_SPECIALIZATION_LC = build_keyword_index("specialization")
+
 # =====================================================
 # HARDCODED DATA - SOLUTION TYPES
 # =====================================================
@@ -124,6 +171,42 @@ def generate_availability_slots():
 # Initialize availability slots (126 total)
 AVAILABILITY_SLOTS = generate_availability_slots()
 
+# Index slots by ID for O(1) lookups
+SLOTS_BY_ID = {s["slot_id"]: s for s in AVAILABILITY_SLOTS}
+
+# Precomputed API representation of each slot
+SLOT_RESPONSES = {
+    s["slot_id"]: {
+        "slot_id": s["slot_id"],
+        "start_time": s["start_time"],
+        "end_time": s["end_time"]
+    }
+    for s in AVAILABILITY_SLOTS
+}
+
+def index_available(slots):
+    """(slot responses, start times, end times) for a start-time-sorted slot list"""
+    return (
+        slots,
+        [s["start_time"] for s in slots],
+        [s["end_time"] for s in slots]
+    )
+
+# Unbooked slots per SPOC as index_available() tuples, sorted by start time
+# (generation order). Entries are replaced, never mutated in place, on
+# booking/cancellation so readers always see a consistent snapshot.
+AVAILABLE_BY_SPOC = {
+    spoc["spoc_id"]: index_available([
+        SLOT_RESPONSES[s["slot_id"]] for s in AVAILABILITY_SLOTS
+        if s["spoc_id"] == spoc["spoc_id"]
+    ])
+    for spoc in SPOCS_DATA
+}
+
+# Slot counters for demo_info, updated on booking/cancellation
+_available_count = len(AVAILABILITY_SLOTS)
+_booked_count = 0
+
 # =====================================================
 # RUNTIME DATA STORAGE (In-Memory)
 # =====================================================
@@ -131,11 +214,122 @@ AVAILABILITY_SLOTS = generate_availability_slots()
 CLIENTS_DATA = []      # Clients created via API
 BOOKINGS_DATA = []     # Bookings created via API
 
+# Indexes by ID (kept in sync with the lists above)
+CLIENTS_BY_ID = {}
+BOOKINGS_BY_ID = {}
+
 # =====================================================
-# PYDANTIC SCHEMAS (Data Validation)
+# HELPERS
 # =====================================================
 
-class SPOCResponse(BaseModel):
+# (second, ISO prefix) - formatting is only redone when the second changes
+_timestamp_cache = (None, "")
+
+def now_isoformat():
+    """Current local time in ISO format, reusing the cached date/time prefix"""
+    global _timestamp_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+
+def match_spocs(query, index, field):
+    """SPOCs whose field contains query: index hit, else substring scan"""
+    query = query.lower()
+    spocs = index.get(query)
+    if spocs is None:
+        spocs = [spoc for spoc, value in SPOCS_FILTER_KEYS[field] if query in value]
+    return spocs
+
+async def decode_body(request: Request, struct_type):
+    """Decode and validate a JSON request body into a msgspec Struct"""
+    try:
+        # strict=False keeps pydantic-style coercion (e.g. "1" -> 1)
+        return msgspec.json.decode(
+            await request.body(), type=struct_type, strict=False
+        )
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+def struct_response(obj, status_code=200):
+    """Encode a msgspec Struct straight to a JSON response"""
+    return Response(
+        content=msgspec.json.encode(obj),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+# Structs referenced by struct_docs; their schemas are added to the OpenAPI
+# components when the spec is generated
+_DOCUMENTED_STRUCTS = []
+
+def struct_docs(response_type, status_code=200, request_type=None, many=False):
+    """
+    OpenAPI request/response bodies for msgspec Structs (FastAPI can't infer
+    them). Documentation only - nothing is validated against these schemas.
+    """
+    def ref(struct_type):
+        if struct_type not in _DOCUMENTED_STRUCTS:
+            _DOCUMENTED_STRUCTS.append(struct_type)
+        return {"$ref": f"#/components/schemas/{struct_type.__name__}"}
+    
+    schema = ref(response_type)
+    if many:
+        schema = {"type": "array", "items": schema}
+    
+    docs = {
+        "responses": {
+            str(status_code): {
+                "description": "Successful Response",
+                "content": {"application/json": {"schema": schema}}
+            }
+        }
+    }
+    if request_type is not None:
+        docs["requestBody"] = {
+            "required": True,
+            "content": {"application/json": {"schema": ref(request_type)}}
+        }
+        # decode_body reports invalid bodies as {"detail": "<message>"}
+        docs["responses"]["422"] = {
+            "description": "Validation Error",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {"detail": {"type": "string"}},
+                        "required": ["detail"]
+                    }
+                }
+            }
+        }
+    return docs
+
+_default_openapi = app.openapi
+
+def openapi_with_structs():
+    """FastAPI's OpenAPI spec plus the schemas of the documented Structs"""
+    if app.openapi_schema is None:
+        spec = _default_openapi()
+        _, components = msgspec.json.schema_components(
+            _DOCUMENTED_STRUCTS, ref_template="#/components/schemas/{name}"
+        )
+        spec.setdefault("components", {}).setdefault("schemas", {}).update(components)
+    return app.openapi_schema
+
+app.openapi = openapi_with_structs
+
+# =====================================================
+# MSGSPEC SCHEMAS (Data Validation)
+# =====================================================
+# Read endpoints return trusted in-memory dicts directly (no response_model
+# re-validation); the response schemas below are attached to each route's
+# OpenAPI docs via struct_docs.
+
+class SPOCResponse(msgspec.Struct):
     """Response schema for SPOC data"""
     spoc_id: int
     name: str
@@ -144,13 +338,13 @@ class SPOCResponse(BaseModel):
     email: str
     phone: str
 
-class AvailabilitySlotResponse(BaseModel):
+class AvailabilitySlotResponse(msgspec.Struct):
     """Response schema for availability slots"""
     slot_id: int
     start_time: str
     end_time: str
 
-class SPOCWithAvailabilityResponse(BaseModel):
+class SPOCWithAvailabilityResponse(msgspec.Struct):
     """SPOC with their available time slots"""
     spoc_id: int
     name: str
@@ -159,7 +353,10 @@ class SPOCWithAvailabilityResponse(BaseModel):
     email: str
     available_slots: List[AvailabilitySlotResponse]
 
-class ClientCreate(BaseModel):
+# Email string, shown as format "email" in the OpenAPI docs
+EmailStr = Annotated[str, msgspec.Meta(extra_json_schema={"format": "email"})]
+
+class ClientCreate(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
     """Request schema for creating a client"""
     company_name: str
     contact_name: Optional[str] = None
@@ -170,7 +367,15 @@ class ClientCreate(BaseModel):
     decision_timeline: Optional[str] = None
     solution_type: Optional[str] = None
 
-class ClientResponse(BaseModel):
+    def __post_init__(self):
+        # Same check as pydantic's EmailStr: accepts "Name <addr>" and
+        # returns the normalized address. Invalid emails raise ValueError,
+        # reported as a validation error
+        if self.contact_email is not None:
+            _, email = validate_email(self.contact_email)
+            msgspec.structs.force_setattr(self, "contact_email", email)
+
+class ClientResponse(msgspec.Struct, kw_only=True):
     """Response schema for client"""
     client_id: str
     company_name: str
@@ -178,14 +383,14 @@ class ClientResponse(BaseModel):
     contact_email: Optional[str] = None
     created_at: str
 
-class BookingCreate(BaseModel):
+class BookingCreate(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
     """Request schema for creating a booking"""
     client_id: str
     spoc_id: int
     slot_id: int
     meeting_type: str
 
-class BookingResponse(BaseModel):
+class BookingResponse(msgspec.Struct):
     """Response schema for booking"""
     booking_id: str
     client_id: str
@@ -196,7 +401,7 @@ class BookingResponse(BaseModel):
     meeting_link: str
     created_at: str
 
-class BookingConfirmation(BaseModel):
+class BookingConfirmation(msgspec.Struct):
     """Simplified response for booking confirmation"""
     booking_id: str
     message: str
@@ -208,40 +413,42 @@ class BookingConfirmation(BaseModel):
 # HEALTH & INFO ENDPOINTS
 # =====================================================
 
+# Constant payloads, serialized once at import time
+_ROOT_BODY = orjson.dumps({
+    "message": "SPOC Booking Platform API (Demo - No Database)",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "redoc": "/redoc",
+    "note": "Using hardcoded in-memory data - perfect for demos"
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "version": "1.0.0",
+    "mode": "in-memory (no database)"
+})
+
 @app.get("/")
 async def root():
     """API root endpoint with basic info"""
-    return {
-        "message": "SPOC Booking Platform API (Demo - No Database)",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "note": "Using hardcoded in-memory data - perfect for demos"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "mode": "in-memory (no database)"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.get("/api/v1/demo/info")
 async def demo_info():
     """Get demo information and current status"""
-    available_slots_count = len([s for s in AVAILABILITY_SLOTS if not s["is_booked"]])
-    booked_slots_count = len([s for s in AVAILABILITY_SLOTS if s["is_booked"]])
-    
     return {
         "mode": "in-memory",
         "data_storage": "Python dictionaries and lists",
         "persistence": "Lost on server restart",
         "total_spocs": len(SPOCS_DATA),
         "total_availability_slots": len(AVAILABILITY_SLOTS),
-        "available_slots_count": available_slots_count,
-        "booked_slots_count": booked_slots_count,
+        "available_slots_count": _available_count,
+        "booked_slots_count": _booked_count,
         "clients_created": len(CLIENTS_DATA),
         "bookings_created": len(BOOKINGS_DATA),
         "note": "Perfect for rapid prototyping and demos"
@@ -250,8 +457,12 @@ async def demo_info():
 # =====================================================
 # SPOC ENDPOINTS
 # =====================================================
+# Endpoints whose work grows with the stored data (scanning or paging
+# through clients/bookings) are plain `def` so FastAPI runs them in the
+# threadpool instead of blocking the event loop. Index lookups (dict gets,
+# bisects) stay `async def` since a thread hop would cost more than the work.
 
-@app.get("/api/v1/spocs", response_model=List[SPOCResponse])
+@app.get("/api/v1/spocs", openapi_extra=struct_docs(SPOCResponse, many=True))
 async def get_spocs(
     solution_type: Optional[str] = Query(None, description="Filter by expertise"),
     expertise: Optional[str] = Query(None, description="Filter by specialization")
@@ -266,16 +477,21 @@ async def get_spocs(
     Returns: List of available SPOCs
     """
     # Start with all SPOCs
-    spocs = SPOCS_DATA.copy()
+    spocs = SPOCS_DATA
     
-    # Apply filters if provided
+    # Apply filters if provided (keyword index lookups)
     if solution_type:
-        spocs = [s for s in spocs 
-                if solution_type.lower() in s["expertise"].lower()]
+        spocs = match_spocs(solution_type, SPOCS_BY_EXPERTISE_LC, "expertise")
     
     if expertise:
-        spocs = [s for s in spocs 
-                if expertise.lower() in s["specialization"].lower()]
+        matches = match_spocs(
+            expertise, SPOCS_BY_SPECIALIZATION_LC, "specialization"
+        )
+        if solution_type:
+            matched_ids = {s["spoc_id"] for s in matches}
+            spocs = [s for s in spocs if s["spoc_id"] in matched_ids]
+        else:
+            spocs = matches
     
     if not spocs:
         raise HTTPException(
@@ -285,7 +501,7 @@ async def get_spocs(
     
     return spocs
 
-@app.get("/api/v1/spocs/{spoc_id}", response_model=SPOCResponse)
+@app.get("/api/v1/spocs/{spoc_id}", openapi_extra=struct_docs(SPOCResponse))
 async def get_spoc_by_id(spoc_id: int):
     """
     Get detailed information about a specific SPOC
@@ -295,7 +511,7 @@ async def get_spoc_by_id(spoc_id: int):
     
     Returns: SPOC information
     """
-    spoc = next((s for s in SPOCS_DATA if s["spoc_id"] == spoc_id), None)
+    spoc = SPOCS_BY_ID.get(spoc_id)
     
     if not spoc:
         raise HTTPException(
@@ -305,7 +521,10 @@ async def get_spoc_by_id(spoc_id: int):
     
     return spoc
 
-@app.get("/api/v1/spocs/{spoc_id}/availability", response_model=SPOCWithAvailabilityResponse)
+@app.get(
+    "/api/v1/spocs/{spoc_id}/availability",
+    openapi_extra=struct_docs(SPOCWithAvailabilityResponse)
+)
 async def get_spoc_availability(
     spoc_id: int,
     start_date: Optional[str] = Query(None, description="Start date (ISO format)"),
@@ -327,45 +546,48 @@ async def get_spoc_availability(
     Returns: SPOC info with available slots
     """
     # Verify SPOC exists
-    spoc = next((s for s in SPOCS_DATA if s["spoc_id"] == spoc_id), None)
+    spoc = SPOCS_BY_ID.get(spoc_id)
     if not spoc:
         raise HTTPException(
             status_code=404, 
             detail="SPOC not found"
         )
     
-    # Get available slots for this SPOC
-    available_slots = [
-        s for s in AVAILABILITY_SLOTS
-        if s["spoc_id"] == spoc_id and not s["is_booked"]
-    ]
-    
-    # Apply date filters if provided
-    if start_date:
-        available_slots = [s for s in available_slots 
-                          if s["start_time"] >= start_date]
-    if end_date:
-        available_slots = [s for s in available_slots 
-                          if s["end_time"] <= end_date]
-    
-    # Sort by start time (earliest first)
-    available_slots.sort(key=lambda x: x["start_time"])
-    
-    return {
+    # Get available slots for this SPOC (already sorted by start time).
+    # The entry is never mutated in place, so no copy is needed.
+    available_slots, start_times, end_times = AVAILABLE_BY_SPOC[spoc_id]
+    
+    # Apply date filters if provided. Slots are sorted by start (and so by
+    # end) time and ISO strings sort correctly, so bisect the range bounds.
+    if start_date or end_date:
+        lo = 0
+        hi = len(available_slots)
+        if start_date:
+            lo = bisect_left(start_times, start_date)
+        if end_date:
+            hi = bisect_right(end_times, end_date)
+        available_slots = available_slots[lo:hi]
+    
+    # Return ORJSONResponse directly to skip jsonable_encoder
+    return ORJSONResponse(content={
         "spoc_id": spoc["spoc_id"],
         "name": spoc["name"],
         "expertise": spoc["expertise"],
         "specialization": spoc["specialization"],
         "email": spoc["email"],
         "available_slots": available_slots
-    }
+    })
 
 # =====================================================
 # CLIENT ENDPOINTS
 # =====================================================
 
-@app.post("/api/v1/clients", response_model=ClientResponse, status_code=201)
-async def create_client(client_data: ClientCreate):
+@app.post(
+    "/api/v1/clients",
+    status_code=201,
+    openapi_extra=struct_docs(ClientResponse, 201, request_type=ClientCreate)
+)
+async def create_client(request: Request):
     """
     Create a new client record
     
@@ -380,28 +602,31 @@ async def create_client(client_data: ClientCreate):
     
     Returns: Created client with generated client_id
     """
+    client_data = await decode_body(request, ClientCreate)
+    
     # Generate unique client ID
-    client_id = str(uuid4())[:8]
+    client_id = secrets.token_hex(4)
     
     # Create client record
     new_client = {
         "client_id": client_id,
-        **client_data.dict(),
-        "created_at": datetime.now().isoformat()
+        **msgspec.structs.asdict(client_data),
+        "created_at": now_isoformat()
     }
     
     # Store in memory
     CLIENTS_DATA.append(new_client)
+    CLIENTS_BY_ID[client_id] = new_client
     
-    return {
-        "client_id": new_client["client_id"],
-        "company_name": new_client["company_name"],
-        "contact_name": new_client.get("contact_name"),
-        "contact_email": new_client.get("contact_email"),
-        "created_at": new_client["created_at"]
-    }
+    return struct_response(ClientResponse(
+        client_id=new_client["client_id"],
+        company_name=new_client["company_name"],
+        contact_name=new_client.get("contact_name"),
+        contact_email=new_client.get("contact_email"),
+        created_at=new_client["created_at"]
+    ), status_code=201)
 
-@app.get("/api/v1/clients/{client_id}", response_model=ClientResponse)
+@app.get("/api/v1/clients/{client_id}", openapi_extra=struct_docs(ClientResponse))
 async def get_client(client_id: str):
     """
     Get client details by ID
@@ -411,10 +636,7 @@ async def get_client(client_id: str):
     
     Returns: Client information
     """
-    client = next(
-        (c for c in CLIENTS_DATA if c["client_id"] == client_id), 
-        None
-    )
+    client = CLIENTS_BY_ID.get(client_id)
     
     if not client:
         raise HTTPException(
@@ -430,8 +652,8 @@ async def get_client(client_id: str):
         "created_at": client["created_at"]
     }
 
-@app.get("/api/v1/clients", response_model=List[ClientResponse])
-async def list_clients(
+@app.get("/api/v1/clients", openapi_extra=struct_docs(ClientResponse, many=True))
+def list_clients(
     skip: int = 0,
     limit: int = 100
 ):
@@ -446,7 +668,7 @@ async def list_clients(
     """
     clients = CLIENTS_DATA[skip:skip+limit]
     
-    return [
+    return ORJSONResponse(content=[
         {
             "client_id": c["client_id"],
             "company_name": c["company_name"],
@@ -455,14 +677,18 @@ async def list_clients(
             "created_at": c["created_at"]
         }
         for c in clients
-    ]
+    ])
 
 # =====================================================
 # BOOKING ENDPOINTS
 # =====================================================
 
-@app.post("/api/v1/bookings", response_model=BookingConfirmation, status_code=201)
-async def create_booking(booking_data: BookingCreate):
+@app.post(
+    "/api/v1/bookings",
+    status_code=201,
+    openapi_extra=struct_docs(BookingConfirmation, 201, request_type=BookingCreate)
+)
+async def create_booking(request: Request):
     """
     Create a new demo/POC booking
     
@@ -482,55 +708,40 @@ async def create_booking(booking_data: BookingCreate):
     
     Returns: Booking confirmation with meeting link
     """
-    # Step 1: Check slot availability
-    slot = next(
-        (s for s in AVAILABILITY_SLOTS
-         if s["slot_id"] == booking_data.slot_id and not s["is_booked"]),
-        None
-    )
-    
-    if not slot:
-        raise HTTPException(
-            status_code=400, 
-            detail="Slot not available or does not exist"
-        )
-    
-    # Step 2: Validate SPOC exists and matches slot
-    spoc = next(
-        (s for s in SPOCS_DATA if s["spoc_id"] == booking_data.spoc_id),
-        None
-    )
-    
-    if not spoc:
-        raise HTTPException(
-            status_code=404, 
-            detail="SPOC not found"
-        )
-    
-    if slot["spoc_id"] != booking_data.spoc_id:
-        raise HTTPException(
-            status_code=400,
-            detail="Selected slot does not belong to this SPOC"
-        )
-    
-    # Step 3: Validate client exists
-    client = next(
-        (c for c in CLIENTS_DATA if c["client_id"] == booking_data.client_id),
-        None
-    )
-    
-    if not client:
-        raise HTTPException(
-            status_code=404, 
-            detail="Client not found"
-        )
+    global _available_count, _booked_count
+    
+    booking_data = await decode_body(request, BookingCreate)
+    
+    # Steps 1-3: Look up slot, SPOC and client, then validate them together
+    # (single check on the happy path; the error reason is resolved after)
+    slot = SLOTS_BY_ID.get(booking_data.slot_id)
+    spoc = SPOCS_BY_ID.get(booking_data.spoc_id)
+    client = CLIENTS_BY_ID.get(booking_data.client_id)
+    
+    if (not slot or slot["is_booked"] or not spoc
+            or slot["spoc_id"] != booking_data.spoc_id or not client):
+        if not slot or slot["is_booked"]:
+            status_code, detail = 400, "Slot not available or does not exist"
+        elif not spoc:
+            status_code, detail = 404, "SPOC not found"
+        elif slot["spoc_id"] != booking_data.spoc_id:
+            status_code, detail = 400, "Selected slot does not belong to this SPOC"
+        else:
+            status_code, detail = 404, "Client not found"
+        raise HTTPException(status_code=status_code, detail=detail)
     
     # Step 4: Generate unique booking ID and meeting link
-    booking_id = str(uuid4())[:8]
+    booking_id = secrets.token_hex(4)
     meeting_link = f"https://meet.example.com/booking/{booking_id}"
     
     # Step 5: Mark slot as booked
     slot["is_booked"] = True
+    _available_count -= 1
+    _booked_count += 1
+    AVAILABLE_BY_SPOC[slot["spoc_id"]] = index_available([
+        s for s in AVAILABLE_BY_SPOC[slot["spoc_id"]][0]
+        if s["slot_id"] != slot["slot_id"]
+    ])
     
     # Step 6: Create booking record
     new_booking = {
@@ -541,22 +752,23 @@ async def create_booking(booking_data: BookingCreate):
         "meeting_type": booking_data.meeting_type,
         "booking_status": "Scheduled",
         "meeting_link": meeting_link,
-        "created_at": datetime.now().isoformat()
+        "created_at": now_isoformat()
     }
     
     # Store booking in memory
     BOOKINGS_DATA.append(new_booking)
+    BOOKINGS_BY_ID[booking_id] = new_booking
     
     # Return confirmation
-    return {
-        "booking_id": booking_id,
-        "message": "Booking created successfully",
-        "spoc_name": spoc["name"],
-        "meeting_link": meeting_link,
-        "start_time": slot["start_time"]
-    }
-
-@app.get("/api/v1/bookings/{booking_id}", response_model=BookingResponse)
+    return struct_response(BookingConfirmation(
+        booking_id=booking_id,
+        message="Booking created successfully",
+        spoc_name=spoc["name"],
+        meeting_link=meeting_link,
+        start_time=slot["start_time"]
+    ), status_code=201)
+
+@app.get("/api/v1/bookings/{booking_id}", openapi_extra=struct_docs(BookingResponse))
 async def get_booking(booking_id: str):
     """
     Get booking details by ID
@@ -566,10 +778,7 @@ async def get_booking(booking_id: str):
     
     Returns: Complete booking information
     """
-    booking = next(
-        (b for b in BOOKINGS_DATA if b["booking_id"] == booking_id),
-        None
-    )
+    booking = BOOKINGS_BY_ID.get(booking_id)
     
     if not booking:
         raise HTTPException(
@@ -579,8 +788,8 @@ async def get_booking(booking_id: str):
     
     return booking
 
-@app.get("/api/v1/bookings", response_model=List[BookingResponse])
-async def list_bookings(
+@app.get("/api/v1/bookings", openapi_extra=struct_docs(BookingResponse, many=True))
+def list_bookings(
     status: Optional[str] = Query(None, description="Filter by status"),
     spoc_id: Optional[int] = Query(None, description="Filter by SPOC"),
     skip: int = 0,
@@ -596,20 +805,16 @@ async def list_bookings(
     
     Returns: List of bookings
     """
-    bookings = BOOKINGS_DATA.copy()
-    
-    # Apply filters
-    if status:
-        bookings = [b for b in bookings if b["booking_status"] == status]
-    
-    if spoc_id:
-        bookings = [b for b in bookings if b["spoc_id"] == spoc_id]
-    
-    # Sort by creation date (newest first)
-    bookings.sort(key=lambda x: x["created_at"], reverse=True)
+    # BOOKINGS_DATA is appended chronologically, so iterating it in
+    # reverse gives newest first without sorting; filters in the same pass
+    bookings = [
+        b for b in reversed(BOOKINGS_DATA)
+        if (not status or b["booking_status"] == status)
+        and (not spoc_id or b["spoc_id"] == spoc_id)
+    ]
     
     # Apply pagination
-    return bookings[skip:skip+limit]
+    return ORJSONResponse(content=bookings[skip:skip+limit])
 
 @app.post("/api/v1/bookings/{booking_id}/cancel")
 async def cancel_booking(booking_id: str):
@@ -626,11 +831,10 @@ async def cancel_booking(booking_id: str):
     
     Returns: Cancellation confirmation
     """
+    global _available_count, _booked_count
+    
     # Find booking
-    booking = next(
-        (b for b in BOOKINGS_DATA if b["booking_id"] == booking_id),
-        None
-    )
+    booking = BOOKINGS_BY_ID.get(booking_id)
     
     if not booking:
         raise HTTPException(
@@ -644,17 +848,21 @@ async def cancel_booking(booking_id: str):
             detail="Booking already cancelled"
         )
     
-    # Update booking status
-    booking["booking_status"] = "Cancelled"
-    
-    # Free up the slot
-    slot = next(
-        (s for s in AVAILABILITY_SLOTS if s["slot_id"] == booking["slot_id"]),
-        None
-    )
+    # Free up the slot (availability index first, then the rest of the state)
+    slot = SLOTS_BY_ID.get(booking["slot_id"])
     
     if slot:
+        slots, start_times, _ = AVAILABLE_BY_SPOC[slot["spoc_id"]]
+        i = bisect_left(start_times, slot["start_time"])
+        AVAILABLE_BY_SPOC[slot["spoc_id"]] = index_available(
+            slots[:i] + [SLOT_RESPONSES[slot["slot_id"]]] + slots[i:]
+        )
         slot["is_booked"] = False
+        _available_count += 1
+        _booked_count -= 1
+    
+    # Update booking status
+    booking["booking_status"] = "Cancelled"
     
     return {
         "message": "Booking cancelled successfully",
@@ -666,9 +874,31 @@ async def cancel_booking(booking_id: str):
 # RUN THE SERVER
 # =====================================================
 
-# Run with:
+# Development (auto-reload):
 # uvicorn main:app --reload --host 0.0.0.0 --port 8000
 #
+# Production (httptools, plus uvloop except on Windows; single worker):
+# python main.py
+#
+# Cython build (python setup.py build_ext --inplace) - run via the import
+# path so the compiled module is picked up (drop --loop uvloop on Windows):
+# uvicorn main:app --loop uvloop --http httptools --host 0.0.0.0 --port 8000
+#
 # Then visit:
 # - API Docs: http://localhost:8000/docs
 # - Demo Info: http://localhost:8000/api/v1/demo/info
+
+if __name__ == "__main__":
+    import sys
+    import uvicorn
+
+    # Single worker only: all state lives in this process's memory, so
+    # extra workers would each hold their own clients, bookings and slots
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        # uvloop isn't available on Windows (see requirements.txt)
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools"
+    )
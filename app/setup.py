@@ -0,0 +1,28 @@
+"""
+Optional Cython build of main.py for deployment
+Compiles the app module to a C extension; no source changes needed
+
+Build (requires Cython and a C compiler):
+    cd app && python setup.py build_ext --inplace
+
+The resulting main.*.so is imported in preference to main.py,
+so `uvicorn main:app` / `python -c "import main"` pick it up automatically.
+Delete the .so to go back to the pure-Python module.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="spoc-booking-api",
+    ext_modules=cythonize(
+        ["main.py"],
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            # Keep annotations as plain Python hints: FastAPI/msgspec read
+            # them at runtime and Query(...) defaults aren't of the hinted type
+            "annotation_typing": False,
+        },
+    ),
+)